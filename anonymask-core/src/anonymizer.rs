@@ -1,10 +1,15 @@
-use crate::config::{AnonymizerConfig, PlaceholderFormat};
+use crate::cache::ResultCache;
+use crate::config::AnonymizerConfig;
 use crate::detection::EntityDetector;
-use crate::entity::{AnonymizationResult, EntityType};
+use crate::entity::{AnonymizationResult, Entity, EntitySpan, EntitySpans, EntityType};
 use crate::error::AnonymaskError;
+use crate::mapping::PlaceholderTable;
+use crate::placeholder::CompiledFormat;
 use std::collections::HashMap;
+use std::ops::ControlFlow;
 use std::sync::atomic::{AtomicUsize, Ordering};
-use uuid::Uuid;
+use std::sync::Mutex;
+use xxhash_rust::xxh3::Xxh3DefaultBuilder;
 
 /// Main anonymization engine for protecting PII in text.
 ///
@@ -14,8 +19,8 @@ use uuid::Uuid;
 ///
 /// # Features
 ///
-/// - Regex-based detection for built-in entity types
-/// - Custom entity support for domain-specific PII
+/// - Single-pass multi-pattern detection for built-in entity types
+/// - Custom entity support for domain-specific PII (Aho-Corasick matching)
 /// - Deterministic placeholder generation (same value = same placeholder)
 /// - Thread-safe operation
 /// - Zero-copy deanonymization
@@ -77,6 +82,10 @@ pub struct Anonymizer {
     detector: EntityDetector,
     config: AnonymizerConfig,
     counter: AtomicUsize,
+    /// Placeholder format, parsed once at construction
+    format: CompiledFormat,
+    /// Recent `anonymize()` results (None if caching is disabled)
+    cache: Option<Mutex<ResultCache>>,
 }
 
 impl Anonymizer {
@@ -145,12 +154,19 @@ impl Anonymizer {
     /// ).unwrap();
     /// ```
     pub fn with_config(entity_types: Vec<EntityType>, config: AnonymizerConfig) -> Result<Self, AnonymaskError> {
-        let detector = EntityDetector::new(&entity_types)?;
+        let detector = EntityDetector::new(&entity_types)?.with_case_sensitivity(config.case_sensitive);
+
+        let cache = match config.result_cache_size {
+            0 => None,
+            size => Some(Mutex::new(ResultCache::new(size))),
+        };
 
         Ok(Anonymizer {
             detector,
+            format: CompiledFormat::new(&config.placeholder_format),
             config,
             counter: AtomicUsize::new(0),
+            cache,
         })
     }
 
@@ -168,8 +184,9 @@ impl Anonymizer {
     ///
     /// An `AnonymizationResult` containing:
     /// - `anonymized_text`: Text with PII replaced
-    /// - `mapping`: HashMap of placeholder -> original value
-    /// - `entities`: Metadata about all detected entities
+    /// - `mapping`: Table of placeholder -> original value
+    /// - `entities`: Metadata about all detected entities (empty if
+    ///   `return_entities` is disabled in the config)
     ///
     /// # Examples
     ///
@@ -186,17 +203,56 @@ impl Anonymizer {
     ///
     /// # Deterministic Behavior
     ///
-    /// The same PII value will always map to the same placeholder within a single
-    /// anonymization operation. However, placeholders change between different
-    /// `anonymize()` calls.
+    /// The same PII value of the same entity type will always map to the same
+    /// placeholder within a single anonymization operation. However, placeholders
+    /// change between different `anonymize()` calls, unless a result cache is
+    /// enabled with `AnonymizerConfig::result_cache_size`, in which case
+    /// repeating a recent call with identical text returns the cached result.
     pub fn anonymize(&self, text: &str) -> Result<AnonymizationResult, AnonymaskError> {
-        self.anonymize_with_custom(text, None)
+        Ok(self
+            .anonymize_detected(text, None)?
+            .unwrap_or_else(|| Self::unchanged(text)))
+    }
+
+    /// Anonymize text, returning `None` when nothing was detected.
+    ///
+    /// Same as [`Anonymizer::anonymize_with_custom`], except that PII-free
+    /// text yields `None` instead of a result holding a copy of `text`, so
+    /// callers that keep the input around pay no allocation for it. Without
+    /// custom entities, the result cache is used as in
+    /// [`Anonymizer::anonymize`].
+    ///
+    /// # Examples
+    ///
+    /// ```
+    /// use anonymask_core::Anonymizer;
+    /// use anonymask_core::entity::EntityType;
+    ///
+    /// let anonymizer = Anonymizer::new(vec![EntityType::Email]).unwrap();
+    /// assert!(anonymizer.anonymize_detected("No PII here", None).unwrap().is_none());
+    /// assert!(anonymizer.anonymize_detected("Mail a@b.io", None).unwrap().is_some());
+    /// ```
+    pub fn anonymize_detected(&self, text: &str, custom_entities: Option<&std::collections::HashMap<EntityType, Vec<String>>>) -> Result<Option<AnonymizationResult>, AnonymaskError> {
+        let cache = match (&self.cache, custom_entities) {
+            (Some(cache), None) => cache,
+            _ => return self.replace_entities(text, custom_entities),
+        };
+
+        if let Some(result) = cache.lock().unwrap_or_else(|e| e.into_inner()).get(text) {
+            return Ok(Some(result));
+        }
+        let result = self.replace_entities(text, None)?;
+        if let Some(result) = &result {
+            cache.lock().unwrap_or_else(|e| e.into_inner()).insert(text, result);
+        }
+        Ok(result)
     }
 
     /// Anonymize text with both built-in and custom entity types.
     ///
     /// Extends the standard anonymization to include user-defined custom entities.
-    /// Custom entities use substring matching rather than regex patterns.
+    /// Custom entities use exact substring matching rather than regex patterns;
+    /// when one value is a prefix of another, the longest match wins.
     ///
     /// # Arguments
     ///
@@ -232,46 +288,126 @@ impl Anonymizer {
     ///
     /// # Note
     ///
-    /// Custom entity matching is case-sensitive and uses exact substring matching.
-    /// For case-insensitive matching, provide lowercase values and lowercase the text.
+    /// Custom entity values are matched as substrings, case-sensitively by
+    /// default. With `AnonymizerConfig::case_sensitive` set to false, ASCII
+    /// values are matched with ASCII case folding. If any value contains
+    /// non-ASCII characters, all values are matched with a Unicode
+    /// case-insensitive regex instead, which is slower.
+    /// The text does not need to be lowercased in either case.
     pub fn anonymize_with_custom(&self, text: &str, custom_entities: Option<&std::collections::HashMap<EntityType, Vec<String>>>) -> Result<AnonymizationResult, AnonymaskError> {
+        Ok(self
+            .replace_entities(text, custom_entities)?
+            .unwrap_or_else(|| Self::unchanged(text)))
+    }
+
+    /// Result for text in which nothing was detected.
+    fn unchanged(text: &str) -> AnonymizationResult {
+        AnonymizationResult {
+            anonymized_text: text.to_string(),
+            mapping: PlaceholderTable::new(),
+            entities: Vec::new(),
+            counts: Vec::new(),
+            spans: EntitySpans::default(),
+        }
+    }
+
+    /// Detect and replace entities in one pass, or `None` if there are none.
+    fn replace_entities(&self, text: &str, custom_entities: Option<&std::collections::HashMap<EntityType, Vec<String>>>) -> Result<Option<AnonymizationResult>, AnonymaskError> {
         if text.is_empty() {
-            return Ok(AnonymizationResult {
-                anonymized_text: String::new(),
-                mapping: HashMap::new(),
-                entities: Vec::new(),
-            });
+            return Ok(None);
         }
 
-        let entities = self.detector.detect(text, custom_entities);
+        // Allocated on the first match, so PII-free text costs no copy
+        let mut anonymized_text = String::new();
+        let mut mapping = PlaceholderTable::new();
+        let mut entities = Vec::new();
+        // Few distinct types per call, so a linear scan beats hashing
+        let mut counts: Vec<(&EntityType, usize)> = Vec::new();
+        let mut spans = Vec::new();
+        // Placeholder index per (entity type, value); keys borrow from the
+        // input text and are hashed with XXH3 instead of SipHash
+        let mut unique_values: HashMap<(&EntityType, &str), usize, Xxh3DefaultBuilder> =
+            HashMap::with_hasher(Xxh3DefaultBuilder::new());
+        // Scratch buffer reused for every new placeholder
+        let mut placeholder = String::new();
+        let mut cursor = 0;
+        let mut detected = 0;
 
-        let mut placeholder_to_original = HashMap::new();
-        let mut anonymized_text = text.to_string();
+        // Detect and replace in one pass: copy the text between matches
+        // verbatim and emit a placeholder for each match as it is found
+        self.detector.scan(text, custom_entities, |entity_type, start, end| {
+            let value = &text[start..end];
+            let index = *unique_values.entry((entity_type, value)).or_insert_with(|| {
+                placeholder.clear();
+                self.generate_placeholder(&mut placeholder, entity_type);
+                mapping.push(&placeholder, value)
+            });
 
-        // Collect unique values and generate placeholders
-        let mut unique_values = HashMap::new();
-        for entity in &entities {
-            if !unique_values.contains_key(&entity.value) {
-                let placeholder = self.generate_placeholder(&entity.entity_type, &entity.value);
-                unique_values.insert(entity.value.clone(), placeholder);
+            if anonymized_text.capacity() == 0 {
+                // Placeholders are usually longer than the values they
+                // replace; leave headroom so typical texts never reallocate
+                anonymized_text.reserve(text.len() + text.len() / 4);
             }
-        }
+            anonymized_text.push_str(&text[cursor..start]);
+            anonymized_text.push_str(mapping.placeholder(index));
+            cursor = end;
 
-        // Build placeholder to original mapping
-        for (original, placeholder) in &unique_values {
-            placeholder_to_original.insert(placeholder.clone(), original.clone());
-        }
+            let type_id = match counts.iter().position(|(kind, _)| *kind == entity_type) {
+                Some(type_id) => type_id,
+                None => {
+                    counts.push((entity_type, 0));
+                    counts.len() - 1
+                }
+            };
+            counts[type_id].1 += 1;
+
+            if self.config.return_entities {
+                entities.push(Entity {
+                    entity_type: entity_type.clone(),
+                    value: value.to_string(),
+                    start,
+                    end,
+                });
+            } else {
+                // Type IDs follow the order of `counts`, whose types become
+                // the span type table below
+                spans.push(EntitySpan {
+                    type_id: type_id as u32,
+                    start,
+                    end,
+                });
+            }
 
-        // Replace in text
-        for (original, placeholder) in &unique_values {
-            anonymized_text = anonymized_text.replace(original, placeholder);
+            // Stop scanning once the entity budget is spent; the rest of
+            // the text is copied through unchanged below
+            detected += 1;
+            if detected == self.config.max_entities {
+                return ControlFlow::Break(());
+            }
+            ControlFlow::Continue(())
+        })?;
+        if detected == 0 {
+            return Ok(None);
         }
+        anonymized_text.push_str(&text[cursor..]);
+
+        let counts: Vec<(EntityType, usize)> = counts
+            .into_iter()
+            .map(|(kind, count)| (kind.clone(), count))
+            .collect();
+        let spans = if spans.is_empty() {
+            EntitySpans::default()
+        } else {
+            EntitySpans::new(counts.iter().map(|(kind, _)| kind.clone()).collect(), spans)
+        };
 
-        Ok(AnonymizationResult {
+        Ok(Some(AnonymizationResult {
             anonymized_text,
-            mapping: placeholder_to_original,
+            mapping,
             entities,
-        })
+            counts,
+            spans,
+        }))
     }
 
     /// Restore original PII values using the anonymization mapping.
@@ -282,7 +418,7 @@ impl Anonymizer {
     /// # Arguments
     ///
     /// * `text` - Anonymized text containing placeholders
-    /// * `mapping` - HashMap mapping placeholders to original values
+    /// * `mapping` - Table mapping placeholders to original values
     ///
     /// # Returns
     ///
@@ -309,79 +445,43 @@ impl Anonymizer {
     ///
     /// # Performance
     ///
-    /// Uses efficient string replacement with O(n*m) complexity where:
+    /// All placeholders are replaced in a single Aho-Corasick pass, O(n + m)
+    /// where:
     /// - n = text length
-    /// - m = number of placeholders
+    /// - m = total length of the placeholders
     ///
-    /// Placeholders are sorted by length (longest first) to avoid
+    /// Overlapping placeholders resolve to the longest one to avoid
     /// partial replacement issues.
     ///
     /// # Note
     ///
     /// If the mapping is incomplete (missing placeholders), those
     /// placeholders will remain in the output text unchanged.
-    pub fn deanonymize(&self, text: &str, mapping: &HashMap<String, String>) -> String {
-        let mut deanonymized_text = text.to_string();
-
-        // Sort placeholders by length descending to avoid partial replacements
-        let mut placeholders: Vec<_> = mapping.keys().collect();
-        placeholders.sort_by_key(|p| std::cmp::Reverse(p.len()));
-
-        for placeholder in placeholders {
-            if let Some(original) = mapping.get(placeholder) {
-                deanonymized_text = deanonymized_text.replace(placeholder, original);
-            }
-        }
-
-        deanonymized_text
+    pub fn deanonymize(&self, text: &str, mapping: &PlaceholderTable) -> String {
+        mapping.deanonymize(text)
     }
 
     /// Generate a unique placeholder for an entity.
     ///
-    /// Creates a placeholder based on the configured format.
+    /// Appends a placeholder in the configured format to `out`.
     /// Supports Standard (TYPE_UUID), Short (TYPE_COUNTER), and Custom formats.
     ///
     /// # Arguments
     ///
+    /// * `out` - Buffer the placeholder is appended to
     /// * `entity_type` - The type of entity being replaced
-    /// * `_value` - The actual PII value (currently unused but reserved for future deterministic generation)
-    ///
-    /// # Returns
-    ///
-    /// A unique placeholder string based on the configuration.
     ///
     /// # Examples
     ///
     /// - Standard: "EMAIL_a1b2c3d4e5f6..."
     /// - Short: "EMAIL_1", "EMAIL_2", etc.
     /// - Custom: "[EMAIL:1]" (with template "[{type}:{counter}]")
-    fn generate_placeholder(&self, entity_type: &EntityType, _value: &str) -> String {
-        let type_prefix = match entity_type {
-            EntityType::Email => "EMAIL",
-            EntityType::Phone => "PHONE",
-            EntityType::Ssn => "SSN",
-            EntityType::CreditCard => "CREDIT_CARD",
-            EntityType::IpAddress => "IP_ADDRESS",
-            EntityType::Url => "URL",
-            EntityType::Custom(name) => name,
+    fn generate_placeholder(&self, out: &mut String, entity_type: &EntityType) {
+        let count = if self.format.uses_counter() {
+            self.counter.fetch_add(1, Ordering::SeqCst) + 1
+        } else {
+            0
         };
-
-        match &self.config.placeholder_format {
-            PlaceholderFormat::Standard => {
-                format!("{}_{}", type_prefix.to_uppercase(), Uuid::new_v4().simple())
-            }
-            PlaceholderFormat::Short => {
-                let count = self.counter.fetch_add(1, Ordering::SeqCst) + 1;
-                format!("{}_{}", type_prefix.to_uppercase(), count)
-            }
-            PlaceholderFormat::Custom(template) => {
-                let count = self.counter.fetch_add(1, Ordering::SeqCst) + 1;
-                let uuid = Uuid::new_v4().simple().to_string();
-                template
-                    .replace("{type}", &type_prefix.to_uppercase())
-                    .replace("{uuid}", &uuid)
-                    .replace("{counter}", &count.to_string())
-            }
-        }
+        self.format.write(out, entity_type, count);
     }
 }
\ No newline at end of file
@@ -0,0 +1,138 @@
+use crate::entity::AnonymizationResult;
+use std::collections::{HashMap, VecDeque};
+use xxhash_rust::xxh3::xxh3_128;
+
+/// Bounded least-recently-used cache of anonymization results.
+///
+/// Keyed by the XXH3-128 hash of the input text. The text itself is kept
+/// alongside each result and compared on lookup, so a hash collision can
+/// never return the mapping of a different input.
+///
+/// Recency is tracked with generation stamps: every use appends a new
+/// `(generation, key)` to `order` instead of moving the key, and stale
+/// stamps are skipped at eviction. Lookups and inserts are thus amortized
+/// O(1) rather than a search through the queue.
+pub(crate) struct ResultCache {
+    capacity: usize,
+    /// Latest generation stamped on each entry, with its text and result
+    entries: HashMap<u128, (u64, Box<str>, AnonymizationResult)>,
+    /// Stamps from least to most recent; stale ones are dropped lazily
+    order: VecDeque<(u64, u128)>,
+    generation: u64,
+}
+
+impl ResultCache {
+    pub(crate) fn new(capacity: usize) -> Self {
+        ResultCache {
+            capacity,
+            entries: HashMap::with_capacity(capacity),
+            order: VecDeque::with_capacity(capacity),
+            generation: 0,
+        }
+    }
+
+    /// Get a copy of the cached result for `text`, marking it recently used.
+    pub(crate) fn get(&mut self, text: &str) -> Option<AnonymizationResult> {
+        let key = xxh3_128(text.as_bytes());
+        let generation = self.generation + 1;
+        match self.entries.get_mut(&key) {
+            Some((stamp, cached_text, result)) if &**cached_text == text => {
+                *stamp = generation;
+                let result = result.clone();
+                self.stamp(generation, key);
+                Some(result)
+            }
+            _ => None,
+        }
+    }
+
+    /// Store the result for `text`, evicting the least recently used entry if full.
+    pub(crate) fn insert(&mut self, text: &str, result: &AnonymizationResult) {
+        if self.capacity == 0 {
+            return;
+        }
+
+        let key = xxh3_128(text.as_bytes());
+        let generation = self.generation + 1;
+        self.entries.insert(key, (generation, text.into(), result.clone()));
+        self.stamp(generation, key);
+
+        while self.entries.len() > self.capacity {
+            let Some((stamp, oldest)) = self.order.pop_front() else {
+                break;
+            };
+            if self.entries.get(&oldest).is_some_and(|entry| entry.0 == stamp) {
+                self.entries.remove(&oldest);
+            }
+        }
+    }
+
+    /// Record a use of `key` at `generation`.
+    fn stamp(&mut self, generation: u64, key: u128) {
+        self.generation = generation;
+        self.order.push_back((generation, key));
+
+        // Repeated hits on cached entries only add stale stamps; drop them
+        // once they outnumber the live ones so `order` stays bounded
+        if self.order.len() > 2 * self.capacity {
+            let entries = &self.entries;
+            self.order
+                .retain(|(stamp, key)| entries.get(key).is_some_and(|entry| entry.0 == *stamp));
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::entity::EntitySpans;
+    use crate::mapping::PlaceholderTable;
+
+    fn result(text: &str) -> AnonymizationResult {
+        AnonymizationResult {
+            anonymized_text: text.to_string(),
+            mapping: PlaceholderTable::new(),
+            entities: Vec::new(),
+            counts: Vec::new(),
+            spans: EntitySpans::default(),
+        }
+    }
+
+    #[test]
+    fn test_evicts_least_recently_used() {
+        let mut cache = ResultCache::new(2);
+        cache.insert("a", &result("A"));
+        cache.insert("b", &result("B"));
+        assert!(cache.get("a").is_some());
+
+        cache.insert("c", &result("C"));
+
+        assert!(cache.get("b").is_none());
+        assert_eq!(cache.get("a").unwrap().anonymized_text, "A");
+        assert_eq!(cache.get("c").unwrap().anonymized_text, "C");
+    }
+
+    #[test]
+    fn test_repeated_hits_keep_order_bounded() {
+        let mut cache = ResultCache::new(2);
+        cache.insert("a", &result("A"));
+        cache.insert("b", &result("B"));
+        for _ in 0..100 {
+            assert!(cache.get("a").is_some());
+        }
+        assert!(cache.order.len() <= 4);
+
+        cache.insert("c", &result("C"));
+
+        assert!(cache.get("b").is_none());
+        assert!(cache.get("a").is_some());
+        assert!(cache.get("c").is_some());
+    }
+
+    #[test]
+    fn test_zero_capacity_stores_nothing() {
+        let mut cache = ResultCache::new(0);
+        cache.insert("a", &result("A"));
+        assert!(cache.get("a").is_none());
+    }
+}
@@ -15,6 +15,7 @@ use serde::{Deserialize, Serialize};
 ///     .build();
 /// ```
 #[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(default)]
 pub struct AnonymizerConfig {
     /// Whether custom entity matching should be case-sensitive
     pub case_sensitive: bool,
@@ -28,7 +29,28 @@ pub struct AnonymizerConfig {
     pub placeholder_format: PlaceholderFormat,
 
     /// Maximum number of entities to detect (0 = unlimited)
+    ///
+    /// Detection stops at the limit; any PII after it is left as-is.
     pub max_entities: usize,
+
+    /// Whether to return the list of detected entities
+    ///
+    /// When false, `AnonymizationResult::entities` is left empty and no
+    /// per-entity values are allocated; `AnonymizationResult::spans` holds
+    /// the entity positions instead. Useful when only the anonymized text
+    /// and mapping are needed.
+    pub return_entities: bool,
+
+    /// Number of recent `anonymize()` results to keep (0 = no caching)
+    ///
+    /// Repeated calls with identical text return the cached result,
+    /// including its placeholders, instead of scanning again. Off by
+    /// default: cached placeholders link repeated inputs to each other.
+    ///
+    /// Each lookup hashes the text and clones the cached result under a
+    /// single lock shared by all threads, so batch calls on many cores
+    /// contend on it; enable it only when inputs actually repeat.
+    pub result_cache_size: usize,
 }
 
 /// Format for generated placeholders.
@@ -62,6 +84,8 @@ impl Default for AnonymizerConfig {
             word_boundary_check: false,
             placeholder_format: PlaceholderFormat::Standard,
             max_entities: 0, // unlimited
+            return_entities: true,
+            result_cache_size: 0,
         }
     }
 }
@@ -105,6 +129,8 @@ pub struct AnonymizerConfigBuilder {
     word_boundary_check: Option<bool>,
     placeholder_format: Option<PlaceholderFormat>,
     max_entities: Option<usize>,
+    return_entities: Option<bool>,
+    result_cache_size: Option<usize>,
 }
 
 impl AnonymizerConfigBuilder {
@@ -140,6 +166,22 @@ impl AnonymizerConfigBuilder {
         self
     }
 
+    /// Set whether to return the list of detected entities.
+    ///
+    /// Default: `true`
+    pub fn with_return_entities(mut self, return_entities: bool) -> Self {
+        self.return_entities = Some(return_entities);
+        self
+    }
+
+    /// Set how many recent `anonymize()` results to cache.
+    ///
+    /// Default: `0` (caching disabled)
+    pub fn with_result_cache_size(mut self, size: usize) -> Self {
+        self.result_cache_size = Some(size);
+        self
+    }
+
     /// Build the configuration.
     pub fn build(self) -> AnonymizerConfig {
         let default = AnonymizerConfig::default();
@@ -148,6 +190,8 @@ impl AnonymizerConfigBuilder {
             word_boundary_check: self.word_boundary_check.unwrap_or(default.word_boundary_check),
             placeholder_format: self.placeholder_format.unwrap_or(default.placeholder_format),
             max_entities: self.max_entities.unwrap_or(default.max_entities),
+            return_entities: self.return_entities.unwrap_or(default.return_entities),
+            result_cache_size: self.result_cache_size.unwrap_or(default.result_cache_size),
         }
     }
 }
@@ -163,6 +207,8 @@ mod tests {
         assert!(!config.word_boundary_check);
         assert_eq!(config.placeholder_format, PlaceholderFormat::Standard);
         assert_eq!(config.max_entities, 0);
+        assert!(config.return_entities);
+        assert_eq!(config.result_cache_size, 0);
     }
 
     #[test]
@@ -172,12 +218,14 @@ mod tests {
             .with_word_boundary_check(true)
             .with_placeholder_format(PlaceholderFormat::Short)
             .with_max_entities(100)
+            .with_return_entities(false)
             .build();
 
         assert!(!config.case_sensitive);
         assert!(config.word_boundary_check);
         assert_eq!(config.placeholder_format, PlaceholderFormat::Short);
         assert_eq!(config.max_entities, 100);
+        assert!(!config.return_entities);
     }
 
     #[test]
@@ -1,5 +1,6 @@
 use serde::{Deserialize, Serialize};
 use crate::error::AnonymaskError;
+use crate::mapping::PlaceholderTable;
 
 /// Type of personally identifiable information (PII) entity.
 ///
@@ -118,6 +119,87 @@ pub struct Entity {
     pub end: usize,
 }
 
+/// Position of a detected entity, without a copy of its value.
+///
+/// The value is `original_text[start..end]`. The entity type is looked up
+/// with [`EntitySpans::entity_type`] on the spans the span came from.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub struct EntitySpan {
+    /// Index of the entity type in [`EntitySpans::types`]
+    pub type_id: u32,
+    /// Starting position in the text (byte index)
+    pub start: usize,
+    /// Ending position in the text (byte index)
+    pub end: usize,
+}
+
+/// Detected entity positions, with each entity type stored once.
+///
+/// Reported instead of `Entity` values when `return_entities` is disabled.
+/// Spans only carry a small type ID, so recording one allocates nothing.
+///
+/// # Examples
+///
+/// ```
+/// use anonymask_core::{Anonymizer, AnonymizerConfig};
+/// use anonymask_core::entity::EntityType;
+///
+/// let config = AnonymizerConfig::builder().with_return_entities(false).build();
+/// let anonymizer = Anonymizer::with_config(vec![EntityType::Email], config).unwrap();
+/// let text = "Contact user@example.com";
+/// let result = anonymizer.anonymize(text).unwrap();
+///
+/// let span = result.spans.iter().next().unwrap();
+/// assert_eq!(result.spans.entity_type(span), &EntityType::Email);
+/// assert_eq!(&text[span.start..span.end], "user@example.com");
+/// ```
+#[derive(Debug, Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct EntitySpans {
+    types: Vec<EntityType>,
+    spans: Vec<EntitySpan>,
+}
+
+impl EntitySpans {
+    /// Create spans from the distinct entity types and the spans indexing them.
+    pub(crate) fn new(types: Vec<EntityType>, spans: Vec<EntitySpan>) -> Self {
+        EntitySpans { types, spans }
+    }
+
+    /// Number of spans.
+    pub fn len(&self) -> usize {
+        self.spans.len()
+    }
+
+    /// Whether there are no spans.
+    pub fn is_empty(&self) -> bool {
+        self.spans.is_empty()
+    }
+
+    /// Distinct entity types, indexed by [`EntitySpan::type_id`].
+    pub fn types(&self) -> &[EntityType] {
+        &self.types
+    }
+
+    /// Entity type of `span`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `span` does not belong to these spans.
+    pub fn entity_type(&self, span: &EntitySpan) -> &EntityType {
+        &self.types[span.type_id as usize]
+    }
+
+    /// All spans, in text order.
+    pub fn as_slice(&self) -> &[EntitySpan] {
+        &self.spans
+    }
+
+    /// Iterate over the spans in text order.
+    pub fn iter(&self) -> std::slice::Iter<'_, EntitySpan> {
+        self.spans.iter()
+    }
+}
+
 /// Result of an anonymization operation.
 ///
 /// Contains the anonymized text, the mapping to restore original values,
@@ -126,8 +208,10 @@ pub struct Entity {
 /// # Fields
 ///
 /// * `anonymized_text` - Text with PII replaced by placeholders
-/// * `mapping` - HashMap mapping placeholders back to original values
+/// * `mapping` - Table mapping placeholders back to original values
 /// * `entities` - List of all detected entities with positions
+/// * `counts` - Number of detected entities per type
+/// * `spans` - Position and type of each detected entity when `entities` is not returned
 ///
 /// # Examples
 ///
@@ -149,9 +233,19 @@ pub struct AnonymizationResult {
     ///
     /// Used to restore original values during deanonymization.
     /// Keys are placeholders (e.g., "EMAIL_abc123"), values are original PII.
-    pub mapping: std::collections::HashMap<String, String>,
+    pub mapping: PlaceholderTable,
     /// All entities detected in the original text
     ///
     /// Includes entity type, value, and position information.
     pub entities: Vec<Entity>,
+    /// Number of detected entities per type, in order of first occurrence
+    ///
+    /// Always filled in, even when `return_entities` is disabled.
+    pub counts: Vec<(EntityType, usize)>,
+    /// Position and type of every detected entity, in text order
+    ///
+    /// Only filled in when `return_entities` is disabled, in place of
+    /// `entities`. Lets callers that only sometimes need the entities build
+    /// them on demand from the original text.
+    pub spans: EntitySpans,
 }
\ No newline at end of file
@@ -42,6 +42,13 @@ pub enum AnonymaskError {
         source: regex::Error,
     },
 
+    /// Multi-pattern matcher construction error
+    ///
+    /// Occurs when the combined built-in pattern set or the custom entity
+    /// automaton cannot be built.
+    #[error("Matcher build error: {0}")]
+    MatcherError(String),
+
     /// Storage backend error
     ///
     /// Occurs when interacting with persistent storage for mappings.
@@ -1,13 +1,17 @@
 pub mod anonymizer;
+mod cache;
 pub mod config;
 pub mod detection;
 pub mod entity;
 pub mod error;
+pub mod mapping;
+mod placeholder;
 
 pub use anonymizer::Anonymizer;
 pub use config::{AnonymizerConfig, AnonymizerConfigBuilder, PlaceholderFormat};
-pub use entity::{AnonymizationResult, Entity, EntityType};
+pub use entity::{AnonymizationResult, Entity, EntitySpan, EntitySpans, EntityType};
 pub use error::AnonymaskError;
+pub use mapping::PlaceholderTable;
 
 #[cfg(test)]
 mod tests {
@@ -178,6 +182,181 @@ mod tests {
         assert_eq!(result.entities[0].value, "John Doe");
     }
 
+    #[test]
+    fn test_custom_entity_longest_match_wins() {
+        let anonymizer = Anonymizer::new(vec![]).unwrap();
+        let mut custom_entities = std::collections::HashMap::new();
+        custom_entities.insert(
+            EntityType::Custom("name".to_string()),
+            vec!["John".to_string(), "John Doe".to_string()],
+        );
+
+        let result = anonymizer
+            .anonymize_with_custom("John Doe met John", Some(&custom_entities))
+            .unwrap();
+
+        assert_eq!(result.entities.len(), 2);
+        assert_eq!(result.entities[0].value, "John Doe");
+        assert_eq!(result.entities[1].value, "John");
+    }
+
+    #[test]
+    fn test_custom_entity_inside_overlapping_match() {
+        let config = AnonymizerConfig::builder()
+            .with_placeholder_format(PlaceholderFormat::Short)
+            .build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Phone], config).unwrap();
+        let mut custom_entities = std::collections::HashMap::new();
+        custom_entities.insert(
+            EntityType::Custom("x".to_string()),
+            vec!["4567 Main Street".to_string(), "Main".to_string()],
+        );
+
+        let result = anonymizer
+            .anonymize_with_custom("Call 555-123-4567 Main Street", Some(&custom_entities))
+            .unwrap();
+
+        assert!(!result.anonymized_text.contains("Main"));
+        assert!(result.anonymized_text.starts_with("Call PHONE_"));
+        assert!(result.anonymized_text.ends_with(" Street"));
+        assert_eq!(result.entities.len(), 2);
+    }
+
+    #[test]
+    fn test_anonymize_all_builtin_types_single_pass() {
+        let anonymizer = Anonymizer::new(vec![
+            EntityType::Email,
+            EntityType::Phone,
+            EntityType::Ssn,
+            EntityType::Url,
+        ])
+        .unwrap();
+        let result = anonymizer
+            .anonymize("Mail a@b.com, call 555-123-4567, SSN 123-45-6789, see https://x.io/p")
+            .unwrap();
+
+        let types: Vec<_> = result.entities.iter().map(|e| e.entity_type.clone()).collect();
+        assert_eq!(
+            types,
+            vec![EntityType::Email, EntityType::Phone, EntityType::Ssn, EntityType::Url]
+        );
+    }
+
+    #[test]
+    fn test_anonymize_without_entities() {
+        let config = AnonymizerConfig::builder().with_return_entities(false).build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Email], config).unwrap();
+        let original = "Email a@b.com and a@b.com";
+        let result = anonymizer.anonymize(original).unwrap();
+
+        assert!(result.entities.is_empty());
+        assert_eq!(result.mapping.len(), 1);
+        assert_eq!(anonymizer.deanonymize(&result.anonymized_text, &result.mapping), original);
+    }
+
+    #[test]
+    fn test_case_insensitive_custom_entities() {
+        let config = AnonymizerConfig::builder().with_case_sensitivity(false).build();
+        let anonymizer = Anonymizer::with_config(vec![], config).unwrap();
+        let mut custom = std::collections::HashMap::new();
+        custom.insert(EntityType::Custom("name".to_string()), vec!["John".to_string()]);
+
+        let result = anonymizer
+            .anonymize_with_custom("john and John are here", Some(&custom))
+            .unwrap();
+        assert_eq!(result.entities.len(), 2);
+        assert!(!result.anonymized_text.to_lowercase().contains("john"));
+    }
+
+    #[test]
+    fn test_counts_per_type() {
+        let anonymizer = Anonymizer::new(vec![EntityType::Email, EntityType::Phone]).unwrap();
+        let result = anonymizer
+            .anonymize("Call 555-123-4567, mail a@test.com or b@test.com")
+            .unwrap();
+
+        assert_eq!(
+            result.counts,
+            vec![(EntityType::Phone, 1), (EntityType::Email, 2)]
+        );
+        assert_eq!(result.entities.len(), 3);
+        assert!(result.spans.is_empty());
+    }
+
+    #[test]
+    fn test_spans_in_text_order_with_large_dictionary() {
+        let names: Vec<String> = (0..500).map(|i| format!("Person{}", i)).collect();
+        let mut custom = std::collections::HashMap::new();
+        custom.insert(EntityType::Custom("name".to_string()), names.clone());
+
+        let text: String = names
+            .iter()
+            .rev()
+            .map(|name| format!("{} <{}@test.com> ", name, name.to_lowercase()))
+            .collect();
+        let config = AnonymizerConfig::builder().with_return_entities(false).build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Email], config).unwrap();
+        let result = anonymizer.anonymize_with_custom(&text, Some(&custom)).unwrap();
+
+        assert_eq!(result.spans.len(), 1000);
+        assert!(result.spans.as_slice().windows(2).all(|pair| pair[0].end <= pair[1].start));
+        assert_eq!(anonymizer.deanonymize(&result.anonymized_text, &result.mapping), text);
+    }
+
+    #[test]
+    fn test_spans_without_entities() {
+        let config = AnonymizerConfig::builder().with_return_entities(false).build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Email, EntityType::Phone], config).unwrap();
+        let text = "Call 555-123-4567, mail a@test.com or b@test.com";
+        let result = anonymizer.anonymize(text).unwrap();
+
+        assert!(result.entities.is_empty());
+        let spans: Vec<(&EntityType, &str)> = result
+            .spans
+            .iter()
+            .map(|span| (result.spans.entity_type(span), &text[span.start..span.end]))
+            .collect();
+        assert_eq!(
+            spans,
+            vec![
+                (&EntityType::Phone, "555-123-4567"),
+                (&EntityType::Email, "a@test.com"),
+                (&EntityType::Email, "b@test.com"),
+            ]
+        );
+        assert_eq!(result.spans.types(), &[EntityType::Phone, EntityType::Email]);
+    }
+
+    #[test]
+    fn test_max_entities_stops_detection() {
+        let config = AnonymizerConfig::builder()
+            .with_max_entities(2)
+            .with_placeholder_format(PlaceholderFormat::Short)
+            .build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Email], config).unwrap();
+        let result = anonymizer
+            .anonymize("Emails: a@test.com, b@test.com, c@test.com, d@test.com")
+            .unwrap();
+
+        assert_eq!(result.entities.len(), 2);
+        assert_eq!(result.mapping.len(), 2);
+        assert!(result.anonymized_text.ends_with(", c@test.com, d@test.com"));
+    }
+
+    #[test]
+    fn test_repeated_text_served_from_cache() {
+        let anonymizer = Anonymizer::new(vec![EntityType::Email]).unwrap();
+        let first = anonymizer.anonymize("Contact john@email.com").unwrap();
+        let second = anonymizer.anonymize("Contact john@email.com").unwrap();
+        assert_ne!(first.anonymized_text, second.anonymized_text);
+
+        let config = AnonymizerConfig::builder().with_result_cache_size(128).build();
+        let anonymizer = Anonymizer::with_config(vec![EntityType::Email], config).unwrap();
+        let first = anonymizer.anonymize("Contact john@email.com").unwrap();
+        let second = anonymizer.anonymize("Contact john@email.com").unwrap();
+        assert_eq!(first.anonymized_text, second.anonymized_text);
+    }
+
     // Property-based tests for regression prevention
     #[cfg(test)]
     mod property_tests {
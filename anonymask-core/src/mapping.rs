@@ -0,0 +1,270 @@
+use aho_corasick::{AhoCorasick, MatchKind};
+use once_cell::sync::OnceCell;
+use serde::de::{Deserialize, Deserializer};
+use serde::ser::{Serialize, SerializeMap, Serializer};
+use std::collections::HashMap;
+use std::fmt;
+use std::sync::Arc;
+use xxhash_rust::xxh3::xxh3_64;
+
+/// Mapping from placeholders back to the original PII values.
+///
+/// Stored as a struct of arrays: all placeholder strings are interned into a
+/// single buffer addressed by offsets, and the originals live in a parallel
+/// column. Placeholders thus cost two allocations however many there are,
+/// while each original is its own shared `Arc<str>`, so cloning a table
+/// never copies the values.
+///
+/// # Examples
+///
+/// ```
+/// use anonymask_core::mapping::PlaceholderTable;
+///
+/// let mut table = PlaceholderTable::new();
+/// table.push("EMAIL_1", "user@example.com");
+///
+/// assert_eq!(table.get("EMAIL_1"), Some("user@example.com"));
+/// assert_eq!(table.deanonymize("Mail EMAIL_1"), "Mail user@example.com");
+/// ```
+#[derive(Clone, Default)]
+pub struct PlaceholderTable {
+    /// All placeholders, concatenated
+    placeholders: String,
+    /// End offset of each placeholder in `placeholders`
+    offsets: Vec<usize>,
+    /// Original value for each placeholder
+    originals: Vec<Arc<str>>,
+    /// Automaton over all placeholders, built on first deanonymization
+    automaton: OnceCell<AhoCorasick>,
+    /// Index of each placeholder by its XXH3 hash, built on first lookup
+    ///
+    /// Only the hash is stored, so the index costs no copies of the
+    /// placeholder strings. On a hash collision the later placeholder is
+    /// left out and found by a linear scan instead.
+    lookup: OnceCell<HashMap<u64, usize>>,
+}
+
+impl PlaceholderTable {
+    /// Create an empty table.
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Append a placeholder and its original value, returning its index.
+    ///
+    /// The caller is responsible for keeping placeholders unique.
+    pub fn push(&mut self, placeholder: &str, original: &str) -> usize {
+        self.placeholders.push_str(placeholder);
+        self.offsets.push(self.placeholders.len());
+        self.originals.push(Arc::from(original));
+        self.automaton = OnceCell::new();
+        self.lookup = OnceCell::new();
+        self.offsets.len() - 1
+    }
+
+    /// Number of placeholders in the table.
+    pub fn len(&self) -> usize {
+        self.offsets.len()
+    }
+
+    /// Whether the table has no placeholders.
+    pub fn is_empty(&self) -> bool {
+        self.offsets.is_empty()
+    }
+
+    /// Placeholder at `index`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `index` is out of bounds.
+    pub fn placeholder(&self, index: usize) -> &str {
+        let start = if index == 0 { 0 } else { self.offsets[index - 1] };
+        &self.placeholders[start..self.offsets[index]]
+    }
+
+    /// Original value at `index`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `index` is out of bounds.
+    pub fn original(&self, index: usize) -> &str {
+        &self.originals[index]
+    }
+
+    /// Look up the original value for a placeholder.
+    ///
+    /// The first lookup builds a hash index over the placeholders (O(n));
+    /// later lookups take constant time until the table changes.
+    pub fn get(&self, placeholder: &str) -> Option<&str> {
+        let lookup = self.lookup.get_or_init(|| {
+            let mut lookup = HashMap::with_capacity(self.len());
+            for (index, key) in self.keys().enumerate() {
+                lookup.entry(xxh3_64(key.as_bytes())).or_insert(index);
+            }
+            lookup
+        });
+
+        let index = match lookup.get(&xxh3_64(placeholder.as_bytes())) {
+            Some(&index) if self.placeholder(index) == placeholder => Some(index),
+            // Colliding hash: only one of the placeholders is indexed
+            Some(_) => self.keys().position(|key| key == placeholder),
+            None => None,
+        };
+        index.map(|index| self.original(index))
+    }
+
+    /// Whether the table contains `placeholder`.
+    pub fn contains_key(&self, placeholder: &str) -> bool {
+        self.get(placeholder).is_some()
+    }
+
+    /// Iterate over placeholders in insertion order.
+    pub fn keys(&self) -> impl ExactSizeIterator<Item = &str> + '_ {
+        (0..self.len()).map(move |index| self.placeholder(index))
+    }
+
+    /// Iterate over original values in insertion order.
+    pub fn values(&self) -> impl ExactSizeIterator<Item = &str> + '_ {
+        self.originals.iter().map(|original| &**original)
+    }
+
+    /// Iterate over `(placeholder, original)` pairs in insertion order.
+    pub fn iter(&self) -> impl ExactSizeIterator<Item = (&str, &str)> + '_ {
+        self.keys().zip(self.values())
+    }
+
+    /// Copy the table into a `HashMap` of placeholder -> original value.
+    pub fn to_hash_map(&self) -> HashMap<String, String> {
+        self.iter()
+            .map(|(placeholder, original)| (placeholder.to_string(), original.to_string()))
+            .collect()
+    }
+
+    /// Replace every placeholder in `text` with its original value.
+    ///
+    /// All placeholders are searched for in a single Aho-Corasick pass.
+    /// When placeholders overlap, the longest one wins, so "EMAIL_10" is
+    /// never restored as "EMAIL_1" followed by "0". The automaton is built
+    /// on the first call and reused until the table changes.
+    pub fn deanonymize(&self, text: &str) -> String {
+        if self.is_empty() {
+            return text.to_string();
+        }
+
+        let automaton = self.automaton.get_or_init(|| {
+            AhoCorasick::builder()
+                .match_kind(MatchKind::LeftmostLongest)
+                .build(self.keys())
+                .expect("placeholder automaton should always build")
+        });
+
+        let mut restored = String::with_capacity(text.len());
+        let mut cursor = 0;
+        for mat in automaton.find_iter(text) {
+            if mat.is_empty() {
+                continue;
+            }
+            restored.push_str(&text[cursor..mat.start()]);
+            restored.push_str(self.original(mat.pattern().as_usize()));
+            cursor = mat.end();
+        }
+        restored.push_str(&text[cursor..]);
+        restored
+    }
+}
+
+impl fmt::Debug for PlaceholderTable {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_map().entries(self.iter()).finish()
+    }
+}
+
+impl<K: AsRef<str>, V: AsRef<str>> FromIterator<(K, V)> for PlaceholderTable {
+    fn from_iter<I: IntoIterator<Item = (K, V)>>(iter: I) -> Self {
+        let mut table = PlaceholderTable::new();
+        for (placeholder, original) in iter {
+            table.push(placeholder.as_ref(), original.as_ref());
+        }
+        table
+    }
+}
+
+impl From<HashMap<String, String>> for PlaceholderTable {
+    fn from(map: HashMap<String, String>) -> Self {
+        map.into_iter().collect()
+    }
+}
+
+impl From<&PlaceholderTable> for HashMap<String, String> {
+    fn from(table: &PlaceholderTable) -> Self {
+        table.to_hash_map()
+    }
+}
+
+impl Serialize for PlaceholderTable {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        let mut map = serializer.serialize_map(Some(self.len()))?;
+        for (placeholder, original) in self.iter() {
+            map.serialize_entry(placeholder, original)?;
+        }
+        map.end()
+    }
+}
+
+impl<'de> Deserialize<'de> for PlaceholderTable {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        HashMap::<String, String>::deserialize(deserializer).map(PlaceholderTable::from)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_push_and_lookup() {
+        let mut table = PlaceholderTable::new();
+        assert_eq!(table.push("EMAIL_1", "a@b.com"), 0);
+        assert_eq!(table.push("PHONE_2", "555-1234"), 1);
+
+        assert_eq!(table.len(), 2);
+        assert_eq!(table.placeholder(1), "PHONE_2");
+        assert_eq!(table.get("EMAIL_1"), Some("a@b.com"));
+        assert_eq!(table.get("EMAIL_2"), None);
+        assert_eq!(
+            table.iter().collect::<Vec<_>>(),
+            vec![("EMAIL_1", "a@b.com"), ("PHONE_2", "555-1234")]
+        );
+    }
+
+    #[test]
+    fn test_deanonymize_prefers_longest_placeholder() {
+        let table: PlaceholderTable = vec![("EMAIL_1", "a@b.com"), ("EMAIL_10", "c@d.com")]
+            .into_iter()
+            .collect();
+
+        assert_eq!(table.deanonymize("EMAIL_10 and EMAIL_1"), "c@d.com and a@b.com");
+    }
+
+    #[test]
+    fn test_push_after_deanonymize() {
+        let mut table = PlaceholderTable::new();
+        table.push("EMAIL_1", "a@b.com");
+        assert_eq!(table.deanonymize("EMAIL_1 PHONE_2"), "a@b.com PHONE_2");
+
+        table.push("PHONE_2", "555-1234");
+        assert_eq!(table.deanonymize("EMAIL_1 PHONE_2"), "a@b.com 555-1234");
+    }
+
+    #[test]
+    fn test_lookup_after_push() {
+        let mut table = PlaceholderTable::new();
+        table.push("EMAIL_1", "a@b.com");
+        assert_eq!(table.get("PHONE_2"), None);
+
+        table.push("PHONE_2", "555-1234");
+        assert_eq!(table.get("PHONE_2"), Some("555-1234"));
+        assert_eq!(table.get("EMAIL_1"), Some("a@b.com"));
+        assert_eq!(table.keys().len(), 2);
+    }
+}
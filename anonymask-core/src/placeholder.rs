@@ -0,0 +1,156 @@
+use crate::config::PlaceholderFormat;
+use crate::entity::EntityType;
+use std::fmt::Write;
+use uuid::Uuid;
+
+/// One step of a compiled placeholder format.
+#[derive(Debug, Clone, PartialEq)]
+enum FormatOp {
+    /// Text copied verbatim
+    Literal(String),
+    /// Entity type, uppercased
+    Type,
+    /// Random UUID v4 in simple (hex) form
+    Uuid,
+    /// Sequential placeholder number
+    Counter,
+}
+
+/// Placeholder format parsed once into a list of operations.
+///
+/// Custom templates are split into literals and `{type}` / `{uuid}` /
+/// `{counter}` slots when the anonymizer is built, so generating a
+/// placeholder only appends to a buffer instead of re-scanning the
+/// template for every detected value.
+#[derive(Debug, Clone)]
+pub(crate) struct CompiledFormat {
+    ops: Vec<FormatOp>,
+    uses_counter: bool,
+}
+
+impl CompiledFormat {
+    pub(crate) fn new(format: &PlaceholderFormat) -> Self {
+        let ops = match format {
+            PlaceholderFormat::Standard => {
+                vec![FormatOp::Type, FormatOp::Literal("_".to_string()), FormatOp::Uuid]
+            }
+            PlaceholderFormat::Short => {
+                vec![FormatOp::Type, FormatOp::Literal("_".to_string()), FormatOp::Counter]
+            }
+            PlaceholderFormat::Custom(template) => parse_template(template),
+        };
+        let uses_counter = ops.contains(&FormatOp::Counter);
+
+        CompiledFormat { ops, uses_counter }
+    }
+
+    /// Whether placeholders include the sequential counter.
+    ///
+    /// Lets the caller skip bumping the shared counter when it is unused.
+    pub(crate) fn uses_counter(&self) -> bool {
+        self.uses_counter
+    }
+
+    /// Append a placeholder for `entity_type` to `out`.
+    ///
+    /// Every `{uuid}` slot in one placeholder gets the same UUID.
+    pub(crate) fn write(&self, out: &mut String, entity_type: &EntityType, counter: usize) {
+        let mut uuid = None;
+        for op in &self.ops {
+            match op {
+                FormatOp::Literal(text) => out.push_str(text),
+                FormatOp::Type => push_type_prefix(out, entity_type),
+                FormatOp::Uuid => {
+                    let uuid = uuid.get_or_insert_with(Uuid::new_v4);
+                    out.push_str(uuid.simple().encode_lower(&mut Uuid::encode_buffer()));
+                }
+                FormatOp::Counter => {
+                    let _ = write!(out, "{}", counter);
+                }
+            }
+        }
+    }
+}
+
+/// Split a custom template into literals and known slots.
+///
+/// Braces that do not form a known slot are kept as literal text.
+fn parse_template(template: &str) -> Vec<FormatOp> {
+    const SLOTS: [(&str, FormatOp); 3] = [
+        ("{type}", FormatOp::Type),
+        ("{uuid}", FormatOp::Uuid),
+        ("{counter}", FormatOp::Counter),
+    ];
+
+    let mut ops = Vec::new();
+    let mut literal = String::new();
+    let mut rest = template;
+    while !rest.is_empty() {
+        match SLOTS.iter().find(|(slot, _)| rest.starts_with(slot)) {
+            Some((slot, op)) => {
+                if !literal.is_empty() {
+                    ops.push(FormatOp::Literal(std::mem::take(&mut literal)));
+                }
+                ops.push(op.clone());
+                rest = &rest[slot.len()..];
+            }
+            None => {
+                let skip = rest.chars().next().map_or(1, char::len_utf8);
+                let next = rest[skip..].find('{').map_or(rest.len(), |i| i + skip);
+                literal.push_str(&rest[..next]);
+                rest = &rest[next..];
+            }
+        }
+    }
+    if !literal.is_empty() {
+        ops.push(FormatOp::Literal(literal));
+    }
+    ops
+}
+
+/// Append the uppercase placeholder prefix for `entity_type`.
+fn push_type_prefix(out: &mut String, entity_type: &EntityType) {
+    let prefix = match entity_type {
+        EntityType::Email => "EMAIL",
+        EntityType::Phone => "PHONE",
+        EntityType::Ssn => "SSN",
+        EntityType::CreditCard => "CREDIT_CARD",
+        EntityType::IpAddress => "IP_ADDRESS",
+        EntityType::Url => "URL",
+        EntityType::Custom(name) => {
+            out.extend(name.chars().flat_map(char::to_uppercase));
+            return;
+        }
+    };
+    out.push_str(prefix);
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn render(format: &PlaceholderFormat, entity_type: &EntityType, counter: usize) -> String {
+        let mut out = String::new();
+        CompiledFormat::new(format).write(&mut out, entity_type, counter);
+        out
+    }
+
+    #[test]
+    fn test_builtin_formats() {
+        assert_eq!(render(&PlaceholderFormat::Short, &EntityType::CreditCard, 3), "CREDIT_CARD_3");
+
+        let standard = render(&PlaceholderFormat::Standard, &EntityType::Email, 0);
+        assert!(standard.starts_with("EMAIL_"));
+        assert_eq!(standard.len(), "EMAIL_".len() + 32);
+        assert!(!CompiledFormat::new(&PlaceholderFormat::Standard).uses_counter());
+    }
+
+    #[test]
+    fn test_custom_template() {
+        let format = PlaceholderFormat::Custom("<{type}-{counter}>".to_string());
+        assert_eq!(render(&format, &EntityType::Custom("name".to_string()), 7), "<NAME-7>");
+
+        let format = PlaceholderFormat::Custom("é{x}{{type}}".to_string());
+        assert_eq!(render(&format, &EntityType::Ssn, 1), "é{x}{SSN}");
+    }
+}
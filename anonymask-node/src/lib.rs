@@ -3,7 +3,7 @@ use std::collections::HashMap;
 
 use anonymask_core::{
     Anonymizer as CoreAnonymizer, AnonymizerConfig as CoreConfig,
-    EntityType, PlaceholderFormat as CorePlaceholderFormat,
+    EntityType, PlaceholderFormat as CorePlaceholderFormat, PlaceholderTable,
 };
 
 #[napi(object)]
@@ -20,6 +20,8 @@ pub struct AnonymizationResult {
   pub anonymized_text: String,
   pub mapping: HashMap<String, String>,
   pub entities: Vec<Entity>,
+  /// Number of detected entities per type
+  pub counts: HashMap<String, u32>,
 }
 
 /// Configuration for anonymizer behavior.
@@ -67,6 +69,7 @@ impl AnonymizerConfig {
       word_boundary_check: self.word_boundary_check,
       placeholder_format,
       max_entities: self.max_entities as usize,
+      ..CoreConfig::default()
     }
   }
 }
@@ -122,20 +125,22 @@ impl Anonymizer {
 
     Ok(AnonymizationResult {
       anonymized_text: result.anonymized_text,
-      mapping: result.mapping,
+      mapping: result.mapping.to_hash_map(),
       entities: result
         .entities
         .into_iter()
         .map(|e| Entity {
-          entity_type: match &e.entity_type {
-            EntityType::Custom(name) => name.clone(),
-            _ => format!("{:?}", e.entity_type).to_lowercase(),
-          },
+          entity_type: entity_type_name(&e.entity_type),
           value: e.value,
           start: e.start as u32,
           end: e.end as u32,
         })
         .collect(),
+      counts: result
+        .counts
+        .iter()
+        .map(|(kind, count)| (entity_type_name(kind), *count as u32))
+        .collect(),
     })
   }
 
@@ -166,25 +171,35 @@ impl Anonymizer {
 
     Ok(AnonymizationResult {
       anonymized_text: result.anonymized_text,
-      mapping: result.mapping,
+      mapping: result.mapping.to_hash_map(),
       entities: result
         .entities
         .into_iter()
         .map(|e| Entity {
-          entity_type: match &e.entity_type {
-            EntityType::Custom(name) => name.clone(),
-            _ => format!("{:?}", e.entity_type).to_lowercase(),
-          },
+          entity_type: entity_type_name(&e.entity_type),
           value: e.value,
           start: e.start as u32,
           end: e.end as u32,
         })
         .collect(),
+      counts: result
+        .counts
+        .iter()
+        .map(|(kind, count)| (entity_type_name(kind), *count as u32))
+        .collect(),
     })
   }
 
   #[napi]
   pub fn deanonymize(&self, text: String, mapping: HashMap<String, String>) -> String {
-    self.inner.deanonymize(&text, &mapping)
+    self.inner.deanonymize(&text, &PlaceholderTable::from(mapping))
+  }
+}
+
+/// Name of an entity type as exposed to JavaScript, e.g. "email".
+fn entity_type_name(entity_type: &EntityType) -> String {
+  match entity_type {
+    EntityType::Custom(name) => name.clone(),
+    _ => format!("{:?}", entity_type).to_lowercase(),
   }
 }
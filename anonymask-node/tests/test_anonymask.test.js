@@ -40,6 +40,13 @@ describe("Anonymizer", () => {
     expect(result.entities).toHaveLength(1);
   });
 
+  test("counts entities per type", () => {
+    const text = "Call 555-123-4567, mail a@test.com or b@test.com";
+    const result = anonymizer.anonymize(text);
+
+    expect(result.counts).toEqual({ phone: 1, email: 2 });
+  });
+
   test("deanonymizes correctly", () => {
     const original = "Contact john@email.com today";
     const result = anonymizer.anonymize(original);
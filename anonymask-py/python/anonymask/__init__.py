@@ -1,5 +1,19 @@
-from ._anonymask import Anonymizer, Entity, AnonymizerConfig
+from ._anonymask import (
+    Anonymizer,
+    AnonymizationResult,
+    Entity,
+    AnonymizerConfig,
+    PlaceholderTable,
+    precompile,
+)
 
 __version__ = "2.0.0"
 
-__all__ = ["Anonymizer", "Entity", "AnonymizerConfig"]
\ No newline at end of file
+__all__ = [
+    "Anonymizer",
+    "AnonymizationResult",
+    "Entity",
+    "AnonymizerConfig",
+    "PlaceholderTable",
+    "precompile",
+]
@@ -1,13 +1,26 @@
 use anonymask_core::*;
-use pyo3::exceptions::PyValueError;
+use mimalloc::MiMalloc;
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::intern;
+use pyo3::marker::Ungil;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyIterator, PyList, PySlice, PyString, PyTuple};
 use pyo3::Bound;
+use rayon::prelude::*;
 
 // Alias the core types to avoid conflict
 use anonymask_core::Anonymizer as CoreAnonymizer;
 use anonymask_core::AnonymizerConfig as CoreConfig;
 use anonymask_core::PlaceholderFormat as CorePlaceholderFormat;
 
+/// Rust-side allocations (placeholders, mappings, entity values) are many
+/// and short-lived; mimalloc serves them faster than the system allocator.
+/// Python objects are still allocated by Python, and no allocation crosses
+/// between the two.
+#[global_allocator]
+static GLOBAL: MiMalloc = MiMalloc;
+
 /// Configuration for anonymizer behavior.
 ///
 /// Provides fine-grained control over how PII is detected and replaced.
@@ -27,6 +40,10 @@ struct PyAnonymizerConfig {
     pub max_entities: usize,
     #[pyo3(get, set)]
     pub placeholder_format: String,
+    #[pyo3(get, set)]
+    pub return_entities: bool,
+    #[pyo3(get, set)]
+    pub result_cache_size: usize,
 }
 
 #[pymethods]
@@ -38,31 +55,37 @@ impl PyAnonymizerConfig {
     ///     word_boundary_check: Check word boundaries for custom entities (default: False)
     ///     placeholder_format: Format for placeholders - "standard", "short", or custom template (default: "standard")
     ///     max_entities: Maximum entities to detect, 0 for unlimited (default: 0)
+    ///     return_entities: Whether to return the detected entities list (default: True)
+    ///     result_cache_size: Number of recent anonymize() results to reuse for identical text, 0 to disable (default: 0). The cache sits behind one lock, so anonymize_many workers contend on it
     ///
     /// Examples:
     ///     >>> config = AnonymizerConfig()
     ///     >>> config = AnonymizerConfig(placeholder_format="short")
     ///     >>> config = AnonymizerConfig(placeholder_format="[{type}:{counter}]")
     #[new]
-    #[pyo3(signature = (case_sensitive=true, word_boundary_check=false, placeholder_format="standard".to_string(), max_entities=0))]
+    #[pyo3(signature = (case_sensitive=true, word_boundary_check=false, placeholder_format="standard".to_string(), max_entities=0, return_entities=true, result_cache_size=0))]
     fn new(
         case_sensitive: bool,
         word_boundary_check: bool,
         placeholder_format: String,
         max_entities: usize,
+        return_entities: bool,
+        result_cache_size: usize,
     ) -> Self {
         PyAnonymizerConfig {
             case_sensitive,
             word_boundary_check,
             placeholder_format,
             max_entities,
+            return_entities,
+            result_cache_size,
         }
     }
 
     fn __repr__(&self) -> String {
         format!(
-            "AnonymizerConfig(case_sensitive={}, word_boundary_check={}, placeholder_format='{}', max_entities={})",
-            self.case_sensitive, self.word_boundary_check, self.placeholder_format, self.max_entities
+            "AnonymizerConfig(case_sensitive={}, word_boundary_check={}, placeholder_format='{}', max_entities={}, return_entities={}, result_cache_size={})",
+            self.case_sensitive, self.word_boundary_check, self.placeholder_format, self.max_entities, self.return_entities, self.result_cache_size
         )
     }
 }
@@ -80,6 +103,8 @@ impl PyAnonymizerConfig {
             word_boundary_check: self.word_boundary_check,
             placeholder_format,
             max_entities: self.max_entities,
+            return_entities: self.return_entities,
+            result_cache_size: self.result_cache_size,
         }
     }
 }
@@ -87,6 +112,8 @@ impl PyAnonymizerConfig {
 #[pyclass(name = "Anonymizer")]
 struct Anonymizer {
     inner: CoreAnonymizer,
+    /// Whether results expose their entity list
+    return_entities: bool,
 }
 
 #[pymethods]
@@ -100,54 +127,63 @@ impl Anonymizer {
             .collect();
         let entity_types = entity_types.map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-        let inner = if let Some(cfg) = config {
-            CoreAnonymizer::with_config(entity_types, cfg.to_core())
-                .map_err(|e| PyValueError::new_err(e.to_string()))?
-        } else {
-            CoreAnonymizer::new(entity_types).map_err(|e| PyValueError::new_err(e.to_string()))?
+        let config = config.map(|cfg| cfg.to_core()).unwrap_or_default();
+        let return_entities = config.return_entities;
+
+        // Entities are built from spans when first read, so the core never
+        // needs to copy out their values
+        let config = CoreConfig {
+            return_entities: false,
+            ..config
         };
+        let inner = CoreAnonymizer::with_config(entity_types, config)
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-        Ok(Anonymizer { inner })
+        Ok(Anonymizer { inner, return_entities })
     }
 
-    fn anonymize(
-        &self,
-        text: &str,
-    ) -> PyResult<(
-        String,
-        std::collections::HashMap<String, String>,
-        Vec<PyEntity>,
-    )> {
-        let result = self
-            .inner
-            .anonymize(text)
+    fn anonymize(&self, text: &Bound<'_, PyString>) -> PyResult<PyAnonymizationResult> {
+        let text_str = text.to_str()?;
+        let result = without_gil_if_long(text.py(), text_str, || self.inner.anonymize_detected(text_str, None))
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        let entities: Vec<PyEntity> = result
-            .entities
-            .into_iter()
-            .map(|e| PyEntity {
-                entity_type: match &e.entity_type {
-                    EntityType::Custom(name) => name.clone(),
-                    _ => format!("{:?}", e.entity_type).to_lowercase(),
-                },
-                value: e.value,
-                start: e.start,
-                end: e.end,
+        PyAnonymizationResult::from_core(text, result, self.return_entities)
+    }
+
+    /// Anonymize a batch of texts in parallel.
+    ///
+    /// The GIL is released while the texts are processed across all cores.
+    /// Each text gets its own result, equivalent to calling `anonymize` on it.
+    ///
+    /// Args:
+    ///     texts: List of texts to anonymize
+    fn anonymize_many(
+        &self,
+        py: Python<'_>,
+        texts: Vec<Bound<'_, PyString>>,
+    ) -> PyResult<Vec<PyAnonymizationResult>> {
+        let strs = texts.iter().map(|text| text.to_str()).collect::<PyResult<Vec<_>>>()?;
+        let inner = &self.inner;
+        let results = py
+            .allow_threads(|| {
+                strs.par_iter()
+                    .map(|text| inner.anonymize_detected(text, None))
+                    .collect::<Result<Vec<_>, _>>()
             })
-            .collect();
-        Ok((result.anonymized_text, result.mapping, entities))
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+
+        texts
+            .iter()
+            .zip(results)
+            .map(|(text, result)| PyAnonymizationResult::from_core(text, result, self.return_entities))
+            .collect()
     }
 
     #[pyo3(signature = (text, custom_entities=None))]
     fn anonymize_with_custom(
         &self,
-        text: &str,
+        text: &Bound<'_, PyString>,
         custom_entities: Option<std::collections::HashMap<String, Vec<String>>>,
-    ) -> PyResult<(
-        String,
-        std::collections::HashMap<String, String>,
-        Vec<PyEntity>,
-    )> {
+    ) -> PyResult<PyAnonymizationResult> {
         // Convert string entity types to EntityType enum
         let custom_entities = match custom_entities {
             Some(map) => {
@@ -162,40 +198,322 @@ impl Anonymizer {
             None => None,
         };
 
-        let result = self
-            .inner
-            .anonymize_with_custom(text, custom_entities.as_ref())
-            .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        let entities: Vec<PyEntity> = result
-            .entities
-            .into_iter()
-            .map(|e| PyEntity {
-                entity_type: match &e.entity_type {
-                    EntityType::Custom(name) => name.clone(),
-                    _ => format!("{:?}", e.entity_type).to_lowercase(),
+        let text_str = text.to_str()?;
+        let result = without_gil_if_long(text.py(), text_str, || {
+            self.inner.anonymize_detected(text_str, custom_entities.as_ref())
+        })
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        PyAnonymizationResult::from_core(text, result, self.return_entities)
+    }
+
+    /// Restore original values in `text`.
+    ///
+    /// Args:
+    ///     text: Text containing placeholders
+    ///     mapping: The PlaceholderTable returned by anonymize, or a dict of placeholder -> original value
+    fn deanonymize(&self, text: &str, mapping: MappingArg<'_>) -> String {
+        match mapping {
+            MappingArg::Table(table) => self.inner.deanonymize(text, &table.get().inner),
+            MappingArg::Dict(map) => self.inner.deanonymize(text, &PlaceholderTable::from(map)),
+        }
+    }
+}
+
+/// Result of `anonymize` / `anonymize_with_custom`.
+///
+/// Indexes, slices, unpacks and compares like the
+/// `(anonymized_text, mapping, entities)` tuple returned by earlier
+/// versions, and also exposes the same values as properties.
+/// The entity list is only built when it is first accessed.
+#[pyclass(name = "AnonymizationResult", frozen, sequence)]
+struct PyAnonymizationResult {
+    text: Py<PyString>,
+    mapping: Py<PyPlaceholderTable>,
+    entities: GILOnceCell<Py<PyList>>,
+    /// Original text, which entity values are sliced from
+    source: Py<PyString>,
+    /// Entities not yet converted to Python objects
+    spans: EntitySpans,
+    counts: Vec<(EntityType, usize)>,
+}
+
+/// Texts at least this long are anonymized with the GIL released.
+///
+/// Releasing and reacquiring the GIL costs more than scanning a short text.
+const RELEASE_GIL_MIN_LEN: usize = 4096;
+
+/// Run `f` for `text`, letting other Python threads run meanwhile if the
+/// text is long enough for that to pay off.
+fn without_gil_if_long<T, F>(py: Python<'_>, text: &str, f: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    if text.len() >= RELEASE_GIL_MIN_LEN {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
+/// Shared empty mapping returned whenever nothing was anonymized
+static EMPTY_TABLE: GILOnceCell<Py<PyPlaceholderTable>> = GILOnceCell::new();
+
+impl PyAnonymizationResult {
+    /// Wrap a core result produced from `input`.
+    ///
+    /// When nothing was detected (`None`) the input string object itself and
+    /// a shared empty table are returned, so PII-free text costs no copies. Entities
+    /// are kept as spans into `input` until the entity list is read; with
+    /// `return_entities` false the list stays empty.
+    fn from_core(
+        input: &Bound<'_, PyString>,
+        result: Option<AnonymizationResult>,
+        return_entities: bool,
+    ) -> PyResult<Self> {
+        let py = input.py();
+        let Some(mut result) = result else {
+            let mapping = EMPTY_TABLE.get_or_try_init(py, || {
+                Py::new(
+                    py,
+                    PyPlaceholderTable {
+                        inner: PlaceholderTable::new(),
+                    },
+                )
+            })?;
+            return Ok(PyAnonymizationResult {
+                text: input.clone().unbind(),
+                mapping: mapping.clone_ref(py),
+                entities: GILOnceCell::new(),
+                source: input.clone().unbind(),
+                spans: EntitySpans::default(),
+                counts: Vec::new(),
+            });
+        };
+
+        if !return_entities {
+            result.spans = EntitySpans::default();
+        }
+
+        Ok(PyAnonymizationResult {
+            text: PyString::new_bound(py, &result.anonymized_text).unbind(),
+            mapping: Py::new(
+                py,
+                PyPlaceholderTable {
+                    inner: result.mapping,
                 },
-                value: e.value,
-                start: e.start,
-                end: e.end,
+            )?,
+            entities: GILOnceCell::new(),
+            source: input.clone().unbind(),
+            spans: result.spans,
+            counts: result.counts,
+        })
+    }
+
+    /// The result as a plain `(text, mapping, entities)` tuple.
+    fn to_tuple<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let items = [
+            self.text(py).into_any(),
+            self.mapping(py).into_any(),
+            self.entities(py)?.into_any(),
+        ];
+        Ok(PyTuple::new_bound(py, items))
+    }
+}
+
+#[pymethods]
+impl PyAnonymizationResult {
+    /// Text with PII replaced by placeholders.
+    #[getter]
+    fn text(&self, py: Python<'_>) -> Py<PyString> {
+        self.text.clone_ref(py)
+    }
+
+    /// Placeholder -> original value mapping.
+    #[getter]
+    fn mapping(&self, py: Python<'_>) -> Py<PyPlaceholderTable> {
+        self.mapping.clone_ref(py)
+    }
+
+    /// Detected entities, built on first access.
+    #[getter]
+    fn entities(&self, py: Python<'_>) -> PyResult<Py<PyList>> {
+        self.entities
+            .get_or_try_init(py, || {
+                let source = self.source.bind(py).to_str()?;
+                // One tag per detected type, shared by all its entities
+                let kinds: Vec<EntityKind> = self
+                    .spans
+                    .types()
+                    .iter()
+                    .map(|entity_type| EntityKind::new(py, entity_type))
+                    .collect();
+
+                let list = PyList::empty_bound(py);
+                for span in self.spans.iter() {
+                    let entity = PyEntity {
+                        kind: kinds[span.type_id as usize].clone_ref(py),
+                        value: source[span.start..span.end].to_string(),
+                        start: span.start,
+                        end: span.end,
+                    };
+                    list.append(Py::new(py, entity)?)?;
+                }
+                Ok::<_, PyErr>(list.unbind())
             })
-            .collect();
-        Ok((result.anonymized_text, result.mapping, entities))
+            .map(|list| list.clone_ref(py))
     }
 
-    fn deanonymize(
-        &self,
-        text: &str,
-        mapping: std::collections::HashMap<String, String>,
-    ) -> String {
-        self.inner.deanonymize(text, &mapping)
+    /// Number of detected entities per type, e.g. `{"email": 2}`.
+    ///
+    /// Tallied during the scan, so this does not build the entity list.
+    #[getter]
+    fn counts<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let counts = PyDict::new_bound(py);
+        for (entity_type, count) in &self.counts {
+            counts.set_item(EntityKind::new(py, entity_type).name(py), count)?;
+        }
+        Ok(counts)
+    }
+
+    fn __len__(&self) -> usize {
+        3
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        // Slices are taken from the full tuple, like `tuple[:2]`
+        if index.is_instance_of::<PySlice>() {
+            return Ok(self.to_tuple(py)?.as_any().get_item(index)?.unbind());
+        }
+        let index: isize = index
+            .extract()
+            .map_err(|_| PyTypeError::new_err("AnonymizationResult indices must be integers or slices"))?;
+        match index {
+            0 | -3 => Ok(self.text(py).into_any()),
+            1 | -2 => Ok(self.mapping(py).into_any()),
+            2 | -1 => Ok(self.entities(py)?.into_any()),
+            _ => Err(PyIndexError::new_err("AnonymizationResult index out of range")),
+        }
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        self.to_tuple(py)?.as_any().iter()
+    }
+
+    /// Compares equal to another result or a tuple with the same items.
+    fn __eq__(&self, py: Python<'_>, other: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let other = if let Ok(result) = other.downcast::<PyAnonymizationResult>() {
+            result.get().to_tuple(py)?
+        } else if let Ok(tuple) = other.downcast::<PyTuple>() {
+            tuple.clone()
+        } else {
+            return Ok(py.NotImplemented());
+        };
+        Ok(self.to_tuple(py)?.eq(other)?.into_py(py))
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> PyResult<String> {
+        Ok(format!(
+            "AnonymizationResult(text={}, mapping={}, entities={})",
+            self.text.bind(py).repr()?,
+            self.mapping.bind(py).repr()?,
+            self.entities(py)?.bind(py).repr()?
+        ))
+    }
+}
+
+/// Mapping accepted by `deanonymize`: a table returned by `anonymize` or a plain dict.
+#[derive(FromPyObject)]
+enum MappingArg<'py> {
+    Table(Bound<'py, PyPlaceholderTable>),
+    Dict(std::collections::HashMap<String, String>),
+}
+
+/// Read-only mapping from placeholders to original values.
+///
+/// Returned as the second element of `anonymize` results. Behaves like a
+/// dict: supports `table[placeholder]`, `len()`, `in`, iteration over
+/// placeholders, `keys()`, `values()`, `items()` and `get()`. Use
+/// `to_dict()` to get a plain dict, e.g. for JSON serialization.
+#[pyclass(name = "PlaceholderTable", frozen, mapping)]
+struct PyPlaceholderTable {
+    inner: PlaceholderTable,
+}
+
+#[pymethods]
+impl PyPlaceholderTable {
+    fn __len__(&self) -> usize {
+        self.inner.len()
+    }
+
+    fn __getitem__<'py>(&self, py: Python<'py>, placeholder: &str) -> PyResult<Bound<'py, PyString>> {
+        self.inner
+            .get(placeholder)
+            .map(|original| PyString::new_bound(py, original))
+            .ok_or_else(|| PyKeyError::new_err(placeholder.to_string()))
+    }
+
+    fn __contains__(&self, placeholder: &str) -> bool {
+        self.inner.contains_key(placeholder)
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        self.keys(py).as_any().iter()
+    }
+
+    /// Get the original value for `placeholder`, or `default` if missing.
+    #[pyo3(signature = (placeholder, default=None))]
+    fn get(&self, py: Python<'_>, placeholder: &str, default: Option<PyObject>) -> PyObject {
+        match self.inner.get(placeholder) {
+            Some(original) => PyString::new_bound(py, original).into_any().unbind(),
+            None => default.unwrap_or_else(|| py.None()),
+        }
+    }
+
+    /// List of placeholders.
+    fn keys<'py>(&self, py: Python<'py>) -> Bound<'py, PyList> {
+        PyList::new_bound(py, self.inner.keys())
+    }
+
+    /// List of original values.
+    fn values<'py>(&self, py: Python<'py>) -> Bound<'py, PyList> {
+        PyList::new_bound(py, self.inner.values())
+    }
+
+    /// List of (placeholder, original) tuples.
+    fn items<'py>(&self, py: Python<'py>) -> Bound<'py, PyList> {
+        PyList::new_bound(py, self.inner.iter())
+    }
+
+    /// Copy the table into a plain dict.
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new_bound(py);
+        for (placeholder, original) in self.inner.iter() {
+            dict.set_item(placeholder, original)?;
+        }
+        Ok(dict)
+    }
+
+    /// Compares equal to another table or a dict with the same items.
+    fn __eq__(&self, py: Python<'_>, other: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let other = if let Ok(table) = other.downcast::<PyPlaceholderTable>() {
+            table.get().to_dict(py)?
+        } else if let Ok(dict) = other.downcast::<PyDict>() {
+            dict.clone()
+        } else {
+            return Ok(py.NotImplemented());
+        };
+        Ok(self.to_dict(py)?.eq(other)?.into_py(py))
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> PyResult<String> {
+        Ok(format!("PlaceholderTable({})", self.to_dict(py)?.repr()?))
     }
 }
 
 #[pyclass(name = "Entity")]
-#[derive(Clone)]
 struct PyEntity {
-    #[pyo3(get)]
-    entity_type: String,
+    kind: EntityKind,
     #[pyo3(get)]
     value: String,
     #[pyo3(get)]
@@ -204,10 +522,96 @@ struct PyEntity {
     end: usize,
 }
 
+#[pymethods]
+impl PyEntity {
+    /// Entity type name, e.g. "email" or a custom type name.
+    #[getter]
+    fn entity_type<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.kind.name(py)
+    }
+}
+
+/// Entity type of an `Entity` without a string allocation per entity.
+///
+/// Built-in types resolve to interned Python strings. A custom type name is
+/// converted once per result and shared by all entities of that type.
+enum EntityKind {
+    Email,
+    Phone,
+    Ssn,
+    CreditCard,
+    IpAddress,
+    Url,
+    Custom(Py<PyString>),
+}
+
+impl EntityKind {
+    fn new(py: Python<'_>, entity_type: &EntityType) -> Self {
+        match entity_type {
+            EntityType::Email => EntityKind::Email,
+            EntityType::Phone => EntityKind::Phone,
+            EntityType::Ssn => EntityKind::Ssn,
+            EntityType::CreditCard => EntityKind::CreditCard,
+            EntityType::IpAddress => EntityKind::IpAddress,
+            EntityType::Url => EntityKind::Url,
+            EntityType::Custom(name) => EntityKind::Custom(PyString::new_bound(py, name).unbind()),
+        }
+    }
+
+    fn clone_ref(&self, py: Python<'_>) -> Self {
+        match self {
+            EntityKind::Email => EntityKind::Email,
+            EntityKind::Phone => EntityKind::Phone,
+            EntityKind::Ssn => EntityKind::Ssn,
+            EntityKind::CreditCard => EntityKind::CreditCard,
+            EntityKind::IpAddress => EntityKind::IpAddress,
+            EntityKind::Url => EntityKind::Url,
+            EntityKind::Custom(name) => EntityKind::Custom(name.clone_ref(py)),
+        }
+    }
+
+    fn name<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match self {
+            EntityKind::Email => intern!(py, "email").clone(),
+            EntityKind::Phone => intern!(py, "phone").clone(),
+            EntityKind::Ssn => intern!(py, "ssn").clone(),
+            EntityKind::CreditCard => intern!(py, "creditcard").clone(),
+            EntityKind::IpAddress => intern!(py, "ipaddress").clone(),
+            EntityKind::Url => intern!(py, "url").clone(),
+            EntityKind::Custom(name) => name.bind(py).clone(),
+        }
+    }
+}
+
+/// Compile the detection patterns ahead of time.
+///
+/// Anonymizers created later for the same entity types reuse the compiled
+/// patterns instead of compiling them on first use. Pass the entity types
+/// the anonymizers will be created with.
+///
+/// Args:
+///     entity_types: Entity types to compile, all built-in types if omitted
+#[pyfunction]
+#[pyo3(signature = (entity_types=None))]
+fn precompile(entity_types: Option<Vec<String>>) -> PyResult<()> {
+    let entity_types = match entity_types {
+        Some(names) => names
+            .iter()
+            .map(|s| EntityType::from_str(s))
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| PyValueError::new_err(e.to_string()))?,
+        None => detection::BUILTIN_TYPES.to_vec(),
+    };
+    detection::EntityDetector::precompile(&entity_types).map_err(|e| PyValueError::new_err(e.to_string()))
+}
+
 #[pymodule]
 fn _anonymask(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(precompile, m)?)?;
     m.add_class::<Anonymizer>()?;
     m.add_class::<PyEntity>()?;
+    m.add_class::<PyPlaceholderTable>()?;
+    m.add_class::<PyAnonymizationResult>()?;
     m.add_class::<PyAnonymizerConfig>()?;
     Ok(())
 }
\ No newline at end of file
@@ -4,7 +4,7 @@ Integration tests for anonymask Python bindings.
 """
 
 import pytest
-from anonymask import Anonymizer, AnonymizerConfig
+from anonymask import Anonymizer, AnonymizerConfig, precompile
 
 
 class TestAnonymizer:
@@ -44,6 +44,58 @@ class TestAnonymizer:
 
         assert deanonymized == original
 
+    def test_mapping_is_dict_like(self):
+        result = self.anonymizer.anonymize("Contact john@email.com")
+        mapping = result[1]
+        placeholder = mapping.keys()[0]
+
+        assert len(mapping) == 1
+        assert placeholder in mapping
+        assert mapping[placeholder] == "john@email.com"
+        assert mapping.get("EMAIL_missing") is None
+        assert dict(mapping.items()) == mapping.to_dict()
+        assert list(mapping) == [placeholder]
+        with pytest.raises(KeyError):
+            mapping["EMAIL_missing"]
+
+    def test_deanonymize_with_dict(self):
+        original = "Contact john@email.com today"
+        result = self.anonymizer.anonymize(original)
+        deanonymized = self.anonymizer.deanonymize(result[0], result[1].to_dict())
+
+        assert deanonymized == original
+
+    def test_result_properties_and_unpacking(self):
+        result = self.anonymizer.anonymize("Contact john@email.com")
+        text, mapping, entities = result
+
+        assert text == result.text == result[0] == result[-3]
+        assert mapping.to_dict() == result.mapping.to_dict()
+        assert len(entities) == len(result.entities) == 1
+        assert result.entities[0].value == "john@email.com"
+        assert len(result) == 3
+        with pytest.raises(IndexError):
+            result[3]
+
+    def test_result_slices_and_compares_like_tuple(self):
+        result = self.anonymizer.anonymize("Contact john@email.com")
+        text, mapping, entities = result
+
+        assert result[:2] == (text, mapping)
+        assert result[::-1] == (entities, mapping, text)
+        assert result == (text, mapping, entities)
+        assert result == (text, mapping.to_dict(), entities)
+        assert result != (text, {}, entities)
+        assert mapping == mapping.to_dict()
+        with pytest.raises(TypeError):
+            result["text"]
+
+    def test_counts(self):
+        text = "Call 555-123-4567, mail a@test.com or b@test.com"
+        result = self.anonymizer.anonymize(text)
+
+        assert result.counts == {"phone": 1, "email": 2}
+
     def test_empty_text(self):
         result = self.anonymizer.anonymize("")
         assert result[0] == ""
@@ -56,6 +108,13 @@ class TestAnonymizer:
         assert result[0] == text
         assert len(result[2]) == 0
 
+    def test_no_entities_returns_input_unchanged(self):
+        text = "This is a regular message with no PII"
+        result = self.anonymizer.anonymize(text)
+
+        assert result.text is text
+        assert len(result.mapping) == 0
+
     def test_duplicate_entities(self):
         text = "Contact john@email.com or reach out to john@email.com again"
         result = self.anonymizer.anonymize(text)
@@ -123,6 +182,40 @@ class TestAnonymizer:
         assert result[2][1].entity_type == "company"
         assert result[2][1].value == "Acme Corp"
 
+    def test_entity_type_shared_per_type(self):
+        anonymizer = Anonymizer(["email"])
+        custom_entities = {"name": ["John", "Jane"]}
+        result = anonymizer.anonymize_with_custom(
+            "John mailed a@test.com and Jane mailed b@test.com", custom_entities
+        )
+
+        types = [entity.entity_type for entity in result.entities]
+        assert types == ["name", "email", "name", "email"]
+        assert types[0] is types[2]
+        assert types[1] is types[3]
+
+    def test_anonymize_many(self):
+        texts = [
+            "Contact john@email.com",
+            "This is a regular message with no PII",
+            "Call 555-123-4567",
+        ]
+        results = self.anonymizer.anonymize_many(texts)
+
+        assert len(results) == len(texts)
+        assert "EMAIL_" in results[0].text
+        assert results[1].text == texts[1]
+        assert "PHONE_" in results[2].text
+        for text, result in zip(texts, results):
+            assert self.anonymizer.deanonymize(result.text, result.mapping) == text
+
+    def test_precompile(self):
+        precompile(["email", "phone"])
+        result = Anonymizer(["phone", "email"]).anonymize("Contact john@email.com")
+
+        assert "EMAIL_" in result[0]
+        assert len(result[2]) == 1
+
 
 class TestAnonymizerConfig:
     """Tests for v2.0.0 configuration features"""
@@ -134,6 +227,8 @@ class TestAnonymizerConfig:
         assert config.word_boundary_check == False
         assert config.placeholder_format == "standard"
         assert config.max_entities == 0
+        assert config.return_entities == True
+        assert config.result_cache_size == 0
 
     def test_config_with_short_format(self):
         """Test using short placeholder format"""
@@ -174,7 +269,11 @@ class TestAnonymizerConfig:
 
         result_sensitive = anonymizer_sensitive.anonymize_with_custom(text, custom_entities)
         # Should only match "John" (case-sensitive)
-        assert result_sensitive[0].count("NAME_") == 1
+        assert result_sensitive.counts == {"name": 1}
+
+        result_insensitive = anonymizer_insensitive.anonymize_with_custom(text, custom_entities)
+        # Should match both "john" and "John"
+        assert result_insensitive.counts == {"name": 2}
 
     def test_config_max_entities(self):
         """Test limiting the maximum number of entities detected"""
@@ -184,10 +283,31 @@ class TestAnonymizerConfig:
         text = "Emails: a@test.com, b@test.com, c@test.com, d@test.com"
         result = anonymizer.anonymize(text)
 
-        # Should detect all emails (max_entities is enforced in detection)
-        # Note: Current implementation doesn't enforce max_entities yet
-        # This test documents expected future behavior
-        assert len(result[2]) >= 1
+        # Detection stops after max_entities; later emails are left as-is
+        assert len(result[2]) == 2
+        assert "c@test.com, d@test.com" in result[0]
+
+    def test_config_without_entities(self):
+        """Test skipping the entity list when only text and mapping are needed"""
+        config = AnonymizerConfig(return_entities=False)
+        anonymizer = Anonymizer(["email"], config)
+
+        text = "Contact user@example.com"
+        result = anonymizer.anonymize(text)
+
+        assert "EMAIL_" in result[0]
+        assert len(result[1]) == 1
+        assert len(result[2]) == 0
+        assert anonymizer.deanonymize(result[0], result[1]) == text
+
+    def test_repeated_text_reuses_result(self):
+        """Test that identical text is served from an enabled result cache"""
+        anonymizer = Anonymizer(["email"])
+        text = "Contact user@example.com"
+        assert anonymizer.anonymize(text)[0] != anonymizer.anonymize(text)[0]
+
+        anonymizer = Anonymizer(["email"], AnonymizerConfig(result_cache_size=128))
+        assert anonymizer.anonymize(text)[0] == anonymizer.anonymize(text)[0]
 
     def test_config_repr(self):
         """Test configuration string representation"""
@@ -32,6 +32,12 @@ function main() {
     });
     console.log();
 
+    console.log('Entities per type:');
+    Object.entries(result.counts).forEach(([entityType, count]) => {
+        console.log(`- ${entityType}: ${count}`);
+    });
+    console.log();
+
     console.log('Mapping (placeholder -> original):');
     Object.entries(result.mapping).forEach(([placeholder, original]) => {
         console.log(`- ${placeholder} -> ${original}`);
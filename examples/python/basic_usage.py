@@ -28,7 +28,12 @@ def main():
 
     print("Detected entities:")
     for entity in result[2]:  # entities
-        print(f"- {entity['entity_type']}: {entity['value']} (positions {entity['start']}-{entity['end']})")
+        print(f"- {entity.entity_type}: {entity.value} (positions {entity.start}-{entity.end})")
+    print()
+
+    print("Entities per type:")
+    for entity_type, count in result.counts.items():
+        print(f"- {entity_type}: {count}")
     print()
 
     print("Mapping (placeholder -> original):")
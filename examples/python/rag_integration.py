@@ -12,16 +12,29 @@ class RAGSystem:
         # Initialize anonymizer for common PII types
         self.anonymizer = Anonymizer(['email', 'phone', 'ssn', 'credit_card'])
 
-    def process_user_query(self, user_query: str) -> dict:
+    def process_user_queries(self, user_queries: list) -> list:
         """
-        Process user query: anonymize, send to LLM, deanonymize response.
+        Process user queries: anonymize the whole batch in parallel, send each
+        to the LLM, and deanonymize the responses.
+        """
+        # Step 1: Anonymize all queries in one parallel batch
+        results = self.anonymizer.anonymize_many(user_queries)
+
+        processed = []
+        for i, (user_query, result) in enumerate(zip(user_queries, results), 1):
+            print(f"\n=== Query {i} ===")
+            processed.append(self.process_anonymized_query(user_query, result))
+            print()
+        return processed
+
+    def process_anonymized_query(self, user_query: str, result) -> dict:
+        """
+        Send an anonymized query to the LLM and deanonymize its response.
         """
         print("User query:", user_query)
 
-        # Step 1: Anonymize the user query
-        result = self.anonymizer.anonymize(user_query)
-        anonymized_query = result[0]
-        mapping = result[1]
+        anonymized_query = result.text
+        mapping = result.mapping
 
         print("Anonymized query:", anonymized_query)
 
@@ -40,7 +53,7 @@ class RAGSystem:
             "original_query": user_query,
             "anonymized_query": anonymized_query,
             "llm_response": original_response,
-            "mapping": mapping
+            "mapping": mapping.to_dict()
         }
 
     def simulate_llm_response(self, anonymized_query: str) -> str:
@@ -65,10 +78,7 @@ def main():
         "I have a credit card ending in 1234"
     ]
 
-    for i, query in enumerate(queries, 1):
-        print(f"\n=== Query {i} ===")
-        result = rag.process_user_query(query)
-        print()
+    rag.process_user_queries(queries)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file